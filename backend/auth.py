@@ -3,6 +3,13 @@ import json
 import hmac
 from jwt_utils import create_jwt, response, CORS_HEADERS, _auth_secret
 
+# Warm the auth secret at init time too (jwt_utils already warms the
+# JWT secret), so the first login doesn't pay two Secrets Manager calls.
+try:
+    _auth_secret()
+except Exception:
+    pass
+
 
 def handler(event, context):
     if event.get('httpMethod') == 'OPTIONS':
@@ -1,50 +1,93 @@
 """S3 trigger Lambda - indexes new emails into DynamoDB."""
 import os
-import email
 import email.policy
 import boto3
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from email.parser import BytesHeaderParser
 from email.utils import parsedate_to_datetime
 
-s3 = boto3.client('s3')
+MAX_WORKERS = 16
+HEADER_PARSER = BytesHeaderParser(policy=email.policy.default)
+
+s3 = boto3.client('s3', config=Config(max_pool_connections=MAX_WORKERS * 2))
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table(os.environ.get('EMAIL_INDEX_TABLE', ''))
 
 
-def handler(event, context):
-    for record in event.get('Records', []):
-        bucket = record['s3']['bucket']['name']
-        key = record['s3']['object']['key']
-        etag = record['s3']['object'].get('eTag', '')
+def _index_record(record, now_iso):
+    """Fetch headers for one S3 record and build its index item (or None to skip)."""
+    bucket = record['s3']['bucket']['name']
+    key = record['s3']['object']['key']
+    etag = record['s3']['object'].get('eTag', '')
+
+    if not key.startswith('incoming/') or key == 'incoming/':
+        return None
 
-        if not key.startswith('incoming/') or key == 'incoming/':
-            continue
+    message_id = key.split('/')[-1]
+    if not message_id:
+        return None
 
-        message_id = key.split('/')[-1]
-        if not message_id:
-            continue
+    # S3 events can be delivered more than once; a cheap keys-only read
+    # lets redeliveries skip the header fetch and parse entirely.
+    try:
+        existing = table.get_item(
+            Key={'messageId': message_id},
+            ProjectionExpression='etag',
+        ).get('Item')
+        if existing is not None and existing.get('etag', '') == etag:
+            print(f"Skipped duplicate {key} -> {message_id}")
+            return None
+    except Exception:
+        pass  # table hiccup: fall through and index (overwrite is idempotent)
 
-        # Fetch headers (first 8KB)
-        obj = s3.get_object(Bucket=bucket, Key=key, Range='bytes=0-8191')
-        raw = obj['Body'].read()
-        msg = email.message_from_bytes(raw, policy=email.policy.default)
+    # Fetch headers (first 8KB)
+    obj = s3.get_object(Bucket=bucket, Key=key, Range='bytes=0-8191')
+    raw = obj['Body'].read()
+    msg = HEADER_PARSER.parsebytes(raw)
 
-        date_str = msg.get('Date', '')
+    date_str = msg.get('Date', '')
+    received_at = now_iso
+    if date_str:
         try:
             received_at = parsedate_to_datetime(date_str).astimezone(timezone.utc).isoformat()
         except Exception:
-            received_at = datetime.now(timezone.utc).isoformat()
-
-        table.put_item(Item={
-            'messageId': message_id,
-            'pk': 'EMAIL',
-            's3Key': key,
-            'etag': etag,
-            'from': msg.get('From', ''),
-            'to': msg.get('To', ''),
-            'subject': msg.get('Subject', '(no subject)'),
-            'date': date_str,
-            'receivedAt': received_at,
-            'size': record['s3']['object'].get('size', 0),
-        })
-        print(f"Indexed {key} -> {message_id}")
+            pass
+
+    print(f"Indexed {key} -> {message_id}")
+    return {
+        'messageId': message_id,
+        'pk': 'EMAIL',
+        's3Key': key,
+        'etag': etag,
+        'from': msg.get('From', ''),
+        'to': msg.get('To', ''),
+        'subject': msg.get('Subject', '(no subject)'),
+        'date': date_str,
+        'receivedAt': received_at,
+        'size': record['s3']['object'].get('size', 0),
+    }
+
+
+def handler(event, context):
+    records = event.get('Records', [])
+    if not records:
+        return
+
+    # Fetch and parse headers concurrently (the per-record work is
+    # network-bound), then batch-write the results: batch_writer buffers
+    # puts into 25-item BatchWriteItem calls and is not thread-safe, so
+    # it runs after the workers join.
+    # One "received now" fallback per invocation, not one per record.
+    now_iso = datetime.now(timezone.utc).isoformat()
+    if len(records) == 1:
+        items = [_index_record(records[0], now_iso)]
+    else:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(records))) as ex:
+            items = list(ex.map(lambda r: _index_record(r, now_iso), records))
+
+    with table.batch_writer(overwrite_by_pkeys=['messageId']) as writer:
+        for item in items:
+            if item:
+                writer.put_item(Item=item)
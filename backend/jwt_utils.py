@@ -10,11 +10,15 @@ JWT_EXPIRY = int(os.environ.get('JWT_EXPIRY', '3600'))
 WEBMAIL_ORIGIN = os.environ.get('WEBMAIL_ORIGIN', '*')
 
 _secrets = {}
+_secrets_client = None
 
 def _get_secret(name):
+    global _secrets_client
     if name not in _secrets:
-        import boto3
-        _secrets[name] = boto3.client('secretsmanager').get_secret_value(SecretId=name)['SecretString']
+        if _secrets_client is None:
+            import boto3
+            _secrets_client = boto3.client('secretsmanager')
+        _secrets[name] = _secrets_client.get_secret_value(SecretId=name)['SecretString']
     return _secrets[name]
 
 def _jwt_secret():
@@ -85,5 +89,14 @@ def response(status: int, body: dict) -> dict:
     return {
         'statusCode': status,
         'headers': CORS_HEADERS,
-        'body': json.dumps(body),
+        'body': json.dumps(body, separators=(',', ':')),
     }
+
+
+# Fetch the JWT secret during the Lambda init phase, which gets burst
+# CPU and runs before the first request, instead of on the first
+# authenticated call. Failures fall back to the lazy fetch above.
+try:
+    _jwt_secret()
+except Exception:
+    pass
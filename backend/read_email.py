@@ -1,25 +1,38 @@
 """Read email Lambda - lookup s3Key from DynamoDB, then fetch full email from S3."""
 import os
-import email
 import email.policy
 import boto3
+from email.parser import BytesFeedParser
 from jwt_utils import require_auth, response, CORS_HEADERS
 
 s3 = boto3.client('s3')
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table(os.environ.get('EMAIL_INDEX_TABLE', ''))
 BUCKET = os.environ.get('EMAIL_BUCKET', '')
+CHUNK_SIZE = 64 * 1024
+
+
+def _parse_stream(body):
+    """Feed the S3 streaming body into the parser in chunks."""
+    parser = BytesFeedParser(policy=email.policy.default)
+    for chunk in iter(lambda: body.read(CHUNK_SIZE), b''):
+        parser.feed(chunk)
+    return parser.close()
 
 
 def _extract_body(msg):
     text = html = None
     if msg.is_multipart():
         for part in msg.walk():
+            if part.get_content_disposition() == 'attachment':
+                continue
             ct = part.get_content_type()
             if ct == 'text/plain' and not text:
                 text = part.get_content()
             elif ct == 'text/html' and not html:
                 html = part.get_content()
+            if text and html:
+                break
     else:
         content = msg.get_content()
         if msg.get_content_type() == 'text/html':
@@ -50,8 +63,9 @@ def handler(event, context):
 
         s3_key = item['s3Key']
         obj = s3.get_object(Bucket=BUCKET, Key=s3_key)
-        raw = obj['Body'].read()
-        msg = email.message_from_bytes(raw, policy=email.policy.default)
+        # Stream the body into the parser instead of buffering the
+        # whole message in memory first.
+        msg = _parse_stream(obj['Body'])
         text_body, html_body = _extract_body(msg)
 
         return response(200, {
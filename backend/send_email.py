@@ -1,11 +1,13 @@
 """Send email Lambda - send via SES."""
 import os
+import re
 import json
 import boto3
 from jwt_utils import require_auth, response, CORS_HEADERS
 
 ses = boto3.client('ses')
 FROM_ADDRESS = os.environ.get('FROM_ADDRESS', '')
+EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
 
 
 def handler(event, context):
@@ -28,8 +30,7 @@ def handler(event, context):
     if not all([to, subject, text]):
         return response(400, {'error': 'Missing to, subject, or body'})
 
-    import re
-    if not re.match(r'^[^@\s]+@[^@\s]+\.[^@\s]+$', to) or len(to) > 254:
+    if len(to) > 254 or '@' not in to or not EMAIL_RE.match(to):
         return response(400, {'error': 'Invalid email address'})
 
     try: